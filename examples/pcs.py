@@ -1,56 +1,70 @@
 import sys
 import os
+import asyncio
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from procyclingstats import (Race, RaceClimbs, RaceStartlist, Ranking, Rider,
                               RiderResults, Scraper, Stage, Team)
 
-""" Example usage of the ProCyclingStats scraper classes. Can be used to sanity check the functionality of the classes. """
+""" Example usage of the ProCyclingStats scraper classes. Can be used to
+sanity check the functionality of the classes. Pages of all scrapers are
+fetched concurrently, so the whole check takes roughly one request
+round-trip instead of one per scraper. Third party "httpx" package is
+needed to run the example. """
 
 RACE_URL = "race/tour-de-france/2022"
 
-def print_parsed_data(scraper_instance, label):
+# scraper classes to check together with URLs of pages to run them against
+SCRAPERS_TO_CHECK = [
+    (Race, f"{RACE_URL}/overview", "RACE"),
+    (RaceClimbs, f"{RACE_URL}/route/climbs", "RACE CLIMBS"),
+    (RaceStartlist, f"{RACE_URL}/startlist", "RACE STARTLIST"),
+    (Ranking, "rankings/me/individual", "RANKING"),
+    (Rider, "rider/tadej-pogacar", "RIDER"),
+    (RiderResults, "rider/tadej-pogacar/results", "RIDER RESULTS"),
+    (Stage, "race/tour-de-france/2022/stage-18", "STAGE"),
+    (Team, "team/ef-education-easypost-2022", "TEAM"),
+]
+
+def parsed_data_lines(scraper_instance, label):
     """
-    Helper function to print parsed data from a scraper instance.
+    Helper function returning output lines of parsed data from a scraper
+    instance.
     """
-    print(f'{label} CLASS')
-    for method in scraper_instance.parse().keys():
-        print(f"{method}: {scraper_instance.parse()[method]}")
-
-def main():
-    # Race class
-    race = Race(f"{RACE_URL}/overview")
-    print_parsed_data(race, "RACE")
-
-    # Race climbs class
-    race_climbs = RaceClimbs(f"{RACE_URL}/route/climbs")
-    print_parsed_data(race_climbs, "RACE CLIMBS")
-
-    # Race startlist class
-    race_start = RaceStartlist(f"{RACE_URL}/startlist")
-    print_parsed_data(race_start, "RACE STARTLIST")
+    lines = [f'{label} CLASS']
+    parsed = scraper_instance.parse()
+    for method in parsed.keys():
+        lines.append(f"{method}: {parsed[method]}")
+    return lines
 
-    # Ranking class
-    ranking = Ranking("rankings/me/individual")
-    print("RANKING CLASS")
-    print(ranking.individual_ranking()[0:5])  # Display first 5 entries
-
-    # Rider class
-    rider = Rider("rider/tadej-pogacar")
-    print_parsed_data(rider, "RIDER")
+async def fetch_htmls(urls):
+    """
+    Fetches HTMLs of all given relative URLs concurrently.
+    """
+    import httpx
 
-    # Rider results class
-    rider_results = RiderResults("rider/tadej-pogacar/results")
-    print_parsed_data(rider_results, "RIDER RESULTS")
+    async with httpx.AsyncClient(follow_redirects=True) as client:
+        responses = await asyncio.gather(
+            *(client.get(Scraper.BASE_URL + url) for url in urls))
+    return [response.text for response in responses]
 
-    # Stage class
-    stage = Stage("race/tour-de-france/2022/stage-18")
-    print_parsed_data(stage, "STAGE")
+def main():
+    urls = [url for _, url, _ in SCRAPERS_TO_CHECK]
+    htmls = asyncio.run(fetch_htmls(urls))
 
-    # Team class
-    team = Team("team/ef-education-easypost-2022")
-    print_parsed_data(team, "TEAM")
+    # collect all output and flush it with a single write instead of one
+    # syscall-backed print per line
+    lines = []
+    for (ScraperClass, url, label), html in zip(SCRAPERS_TO_CHECK, htmls):
+        if ScraperClass is Ranking:
+            ranking = Ranking(url, html=html, update_html=False)
+            lines.append("RANKING CLASS")
+            # Display first 5 entries
+            lines.append(str(ranking.individual_ranking()[0:5]))
+        else:
+            scraper = ScraperClass(url, html=html, update_html=False)
+            lines.extend(parsed_data_lines(scraper, label))
+    sys.stdout.write("\n".join(lines) + "\n")
 
 if __name__ == "__main__":
     main()
-
@@ -1,28 +1,68 @@
-import os
-import sys
-
-from .race_climbs_scraper import RaceClimbs
-from .race_combative_riders_scraper import RaceCombativeRiders
-from .race_scraper import Race
-from .race_startlist_scraper import RaceStartlist
-from .ranking_scraper import Ranking
-from .rider_results_scraper import RiderResults
-from .rider_scraper import Rider
-from .scraper import Scraper
-from .stage_scraper import Stage
-from .team_scraper import Team
-
-__all__ = [
-    "Scraper",
-    "RaceClimbs",
-    "RaceCombativeRiders",
-    "Race",
-    "RaceStartlist",
-    "Ranking",
-    "RiderResults",
-    "Rider",
-    "Stage",
-    "Team"
-]
-
-sys.path.append(os.path.dirname(os.path.realpath(__file__)))
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .race_climbs_scraper import RaceClimbs
+    from .race_combative_riders_scraper import RaceCombativeRiders
+    from .race_scraper import Race
+    from .race_startlist_scraper import RaceStartlist
+    from .ranking_scraper import Ranking
+    from .rider_results_scraper import RiderResults
+    from .rider_scraper import Rider
+    from .scraper import Scraper
+    from .stage_scraper import Stage
+    from .team_scraper import Team
+    from .today_races_scraper import TodayRaces
+
+__all__ = [
+    "Scraper",
+    "RaceClimbs",
+    "RaceCombativeRiders",
+    "Race",
+    "RaceStartlist",
+    "Ranking",
+    "RiderResults",
+    "Rider",
+    "Stage",
+    "Team",
+    "TodayRaces"
+]
+
+# submodules that scraper classes are lazily imported from
+_SUBMODULES = {
+    "Scraper": ".scraper",
+    "RaceClimbs": ".race_climbs_scraper",
+    "RaceCombativeRiders": ".race_combative_riders_scraper",
+    "Race": ".race_scraper",
+    "RaceStartlist": ".race_startlist_scraper",
+    "Ranking": ".ranking_scraper",
+    "RiderResults": ".rider_results_scraper",
+    "Rider": ".rider_scraper",
+    "Stage": ".stage_scraper",
+    "Team": ".team_scraper",
+    "TodayRaces": ".today_races_scraper"
+}
+
+
+def __getattr__(name: str):
+    """
+    Imports scraper classes lazily on first attribute access (PEP 562), so
+    `import procyclingstats` doesn't pay for loading every scraper module
+    up front.
+    """
+    try:
+        submodule = _SUBMODULES[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}") from None
+    scraper_class = getattr(import_module(submodule, __package__), name)
+    # cache on the package so __getattr__ isn't hit again for this name
+    globals()[name] = scraper_class
+    return scraper_class
+
+
+def __dir__():
+    # __all__ already names every public attribute, so don't mix in
+    # globals(): that duplicated lazily-cached classes and leaked
+    # internals like _SUBMODULES
+    return sorted(__all__)
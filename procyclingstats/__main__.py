@@ -7,8 +7,9 @@ from tabulate import tabulate
 
 # imports all scraping classes that are listed in `scraper_classes` tuple and
 # Scraper class
-from .__init__ import (Race, RaceClimbs, RaceStartlist, Ranking, Rider,
-                       RiderResults, Scraper, Stage, Team, RaceCombativeRiders)
+from . import (Race, RaceClimbs, RaceStartlist, Ranking, Rider,
+               RiderResults, Scraper, Stage, Team, RaceCombativeRiders,
+               TodayRaces)
 
 scraper_classes = (
     Race,
@@ -19,7 +20,8 @@ scraper_classes = (
     Team,
     RiderResults,
     RaceClimbs,
-    RaceCombativeRiders
+    RaceCombativeRiders,
+    TodayRaces
 )
 
 def configure_parser():
@@ -46,6 +48,8 @@ def get_corresponding_scraping_class(relative_url: str) -> Any:
     :param relative_url: Relative URL of some PCS page.
     :return: Scraping class for the URL. None when not found.
     """
+    if relative_url in ("", "index.php"):
+        return TodayRaces
     splitted_url = relative_url.split("/")
     if "comative-riders" in splitted_url or "combative-riders" in splitted_url:
         return RaceCombativeRiders
@@ -0,0 +1,481 @@
+import asyncio
+from functools import cached_property
+from sys import intern
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import urlencode
+
+import requests
+from requests.adapters import HTTPAdapter
+from selectolax.parser import HTMLParser
+
+from .scraper import Scraper
+
+# httpx and HTTP/2 support are optional; resolve their availability once at
+# import time, since failed imports aren't cached by Python and would cost
+# a sys.path scan on every fallback otherwise
+try:
+    import httpx
+except ImportError:
+    httpx = None  # type: ignore
+try:
+    import h2  # noqa: F401 pylint: disable=unused-import
+except ImportError:
+    h2 = None  # type: ignore
+
+# Shared module-level session so repeated `race_urls_for_date` calls reuse
+# pooled keep-alive connections instead of paying the TCP+TLS handshake on
+# every call.
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+_session.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+_session.headers.update({
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 " +
+        "(KHTML, like Gecko) Chrome/104.0.0.0 Safari/537.36"
+})
+
+
+# calendar page URL base, joined with an urlencoded date query per lookup
+_CALENDAR_URL = Scraper.BASE_URL + "races.php"
+
+# selector strings used repeatedly by parsing methods
+_RESULTS_UL_SEL = "h3.black-info-title + ul.hp2-results"
+_NEXT_TBODY_SEL = "h3.black-info-title + table > tbody"
+_LIVE_LI_SEL = "ul.hp2-live > li"
+
+
+def _calendar_url(date: str) -> str:
+    """
+    Builds PCS calendar page URL for given date.
+
+    :param date: Date in ``YYYY-MM-DD`` format.
+    :return: Absolute calendar page URL with the date safely urlencoded.
+    """
+    return f"{_CALENDAR_URL}?{urlencode({'date': date})}"
+
+
+def _has_class(node: Any, class_name: str) -> bool:
+    """
+    Checks whether given node has given class, matching whole class names
+    instead of substrings (so e.g. 'togo' doesn't match 'togop').
+
+    :param node: Node which class attribute to check.
+    :param class_name: Class name to look for.
+    :return: True when the node has the class, otherwise False.
+    """
+    return class_name in (node.attributes.get("class") or "").split()
+
+
+def get_session() -> requests.Session:
+    """
+    Returns the shared module-level session used for calendar requests.
+
+    :return: Shared `requests.Session` with connection pooling configured.
+    """
+    return _session
+
+
+_httpx_client: Any = None
+
+
+def _make_httpx_client(async_client: bool = False) -> Any:
+    """
+    Creates an httpx client with HTTP/2 enabled when the `h2` package is
+    installed. Third party `httpx` package is needed.
+
+    :param async_client: Whether to create `httpx.AsyncClient` instead of
+        `httpx.Client`, defaults to False.
+    :raises ImportError: When `httpx` isn't installed.
+    :return: Created client.
+    """
+    if httpx is None:
+        raise ImportError("httpx package is needed to create httpx clients.")
+    # follow redirects like the requests fallback session does, so both
+    # transports land on the same page for a given URL
+    kwargs: Dict[str, Any] = {"headers": dict(_session.headers),
+                              "follow_redirects": True}
+    if h2 is not None:
+        kwargs["http2"] = True
+    return httpx.AsyncClient(**kwargs) if async_client \
+        else httpx.Client(**kwargs)
+
+
+def _get_httpx_client() -> Any:
+    """
+    Returns the shared module-level `httpx.Client`, creating it on first
+    use.
+
+    :raises ImportError: When `httpx` isn't installed.
+    :return: Shared client.
+    """
+    global _httpx_client  # pylint: disable=global-statement
+    if _httpx_client is None:
+        _httpx_client = _make_httpx_client()
+    return _httpx_client
+
+
+class TodayRaces(Scraper):
+    """
+    Scraper for procyclingstats homepage with races of the current day.
+
+    Usage:
+
+    >>> from procyclingstats import TodayRaces
+    >>> today_races = TodayRaces()
+    >>> today_races.finished_races()
+    [
+        {
+            'race_name': 'Bretagne Classic - Ouest-France',
+            'race_url': 'race/bretagne-classic/2022/result',
+            'category': '1.UWT'
+        },
+        ...
+    ]
+    >>> today_races.parse()
+    {
+        'finished_races': [
+            {
+                'race_name': 'Bretagne Classic - Ouest-France',
+                'race_url': 'race/bretagne-classic/2022/result',
+                'category': '1.UWT'
+            },
+            ...
+        ],
+        ...
+    }
+    """
+    _public_nonparsing_methods = Scraper._public_nonparsing_methods + (
+        "race_urls_for_date",
+        "race_urls_for_date_async",
+        "race_urls_for_dates",
+    )
+
+    def __init__(self, url: str = "index.php", html: Optional[str] = None,
+                 update_html: bool = True) -> None:
+        super().__init__(url, html, update_html)
+
+    def race_urls_for_date(self, date: str) -> List[str]:
+        """
+        Fetches PCS calendar page for given date and parses URLs of races
+        held on that date.
+
+        Successful lookups are cached per date, so asking for the same date
+        again skips the request entirely. Call
+        ``TodayRaces._race_urls_cache.clear()`` to drop cached results.
+
+        :raises HTTPError: When the calendar request returns an error
+            status (``httpx.HTTPStatusError`` when httpx is used).
+        :param date: Date in ``YYYY-MM-DD`` format.
+        :return: List of relative race URLs, e.g.
+            ``race/tour-de-france/2022``.
+        """
+        return list(self._fetch_race_urls(_calendar_url(date)))
+
+    # successful lookups keyed by calendar page URL; error responses raise
+    # and empty results aren't stored, so a transient 5xx, CAPTCHA or
+    # maintenance page can't pin an empty result for a date
+    _race_urls_cache: Dict[str, Tuple[str, ...]] = {}
+    _RACE_URLS_CACHE_MAXSIZE = 128
+
+    @staticmethod
+    def _fetch_race_urls(url: str) -> Tuple[str, ...]:
+        """
+        Fetches given calendar page URL and parses race URLs from it.
+
+        :raises HTTPError: When the response has an error status
+            (``httpx.HTTPStatusError`` when httpx is used).
+        :param url: Absolute URL of PCS calendar page.
+        :return: Relative race URLs as tuple, so the cached value can't be
+            mutated by callers.
+        """
+        cache = TodayRaces._race_urls_cache
+        cached = cache.get(url)
+        if cached is not None:
+            return cached
+
+        # prefer httpx with HTTP/2 when installed, otherwise fall back to
+        # the shared requests session
+        if httpx is not None:
+            response = _get_httpx_client().get(url)
+        else:
+            response = get_session().get(url)
+        response.raise_for_status()
+
+        race_urls = tuple(TodayRaces._parse_race_urls(response.content))
+        if race_urls:
+            if len(cache) >= TodayRaces._RACE_URLS_CACHE_MAXSIZE:
+                # drop the oldest entry, insertion order is good enough here
+                del cache[next(iter(cache))]
+            cache[url] = race_urls
+        return race_urls
+
+    async def race_urls_for_date_async(self, date: str,
+                                       client: Any = None) -> List[str]:
+        """
+        Async variant of `race_urls_for_date`. Third party `httpx` package
+        is needed to use this method.
+
+        :raises httpx.HTTPStatusError: When the calendar request returns an
+            error status.
+        :param date: Date in ``YYYY-MM-DD`` format.
+        :param client: Optional `httpx.AsyncClient` to make the request
+            with. When None a new client is created for the single request.
+        :return: List of relative race URLs.
+        """
+        url = _calendar_url(date)
+        if client is not None:
+            response = await client.get(url)
+        else:
+            async with _make_httpx_client(async_client=True) as new_client:
+                response = await new_client.get(url)
+        # propagate error responses like the sync variant instead of
+        # parsing them to an empty list
+        response.raise_for_status()
+        return self._parse_race_urls(response.content)
+
+    async def race_urls_for_dates(self, dates: List[str],
+            max_concurrent_requests: int = 10) -> List[List[str]]:
+        """
+        Fetches PCS calendar pages for all given dates concurrently and
+        parses race URLs from each of them. Third party `httpx` package is
+        needed to use this method.
+
+        :raises httpx.HTTPStatusError: When any of the calendar requests
+            returns an error status.
+        :param dates: Dates in ``YYYY-MM-DD`` format.
+        :param max_concurrent_requests: Count of requests that are allowed
+            to run at the same time, defaults to 10.
+        :return: List of race URL lists in the same order as given dates.
+        """
+        semaphore = asyncio.Semaphore(max_concurrent_requests)
+
+        async def fetch(client: Any, date: str) -> List[str]:
+            async with semaphore:
+                return await self.race_urls_for_date_async(date, client)
+
+        async with _make_httpx_client(async_client=True) as client:
+            tasks = [fetch(client, date) for date in dates]
+            return list(await asyncio.gather(*tasks))
+
+    @staticmethod
+    def _parse_race_urls(html_str: Union[str, bytes]) -> List[str]:
+        """
+        Parses race URLs from given calendar page HTML.
+
+        :param html_str: HTML of PCS calendar page, as str or raw response
+            bytes. Passing bytes skips the Python-level charset detection
+            and decode that `response.text` does.
+        :return: List of relative race URLs.
+        """
+        html = HTMLParser(html_str)
+        page_content_div = html.css_first("div.page-content")
+        if page_content_div is None:
+            return []
+
+        race_urls = []
+        # prefix filtering is done by the selector engine, so only race links
+        # cross the C<->Python boundary
+        for a in page_content_div.css('a[href^="race/"], a[href^="/race/"]'):
+            href = a.attributes.get("href", "")
+            if href.startswith("/"):
+                href = href[1:]
+            href = intern(href)
+            if href not in race_urls:
+                race_urls.append(href)
+        return race_urls
+
+    def live_races(self) -> List[Dict[str, Any]]:
+        """
+        Parses races that are currently live from HTML.
+
+        :return: Table represented as list of dicts with keys ``race_name``,
+            ``race_url`` and ``km_to_go``.
+        """
+        races = []
+        for li in self.html.css(_LIVE_LI_SEL):
+            # gather link, title and km to go with a single subtree-scoped
+            # query instead of three separate css_first lookups per list
+            # item; traverse() is no good here as it walks past the end of
+            # the list item into following siblings
+            a = title = togo = None
+            for node in li.css("a, span.title, div.togo"):
+                if a is None and node.tag == "a":
+                    a = node
+                elif (title is None and node.tag == "span" and
+                        _has_class(node, "title")):
+                    title = node
+                elif (togo is None and node.tag == "div" and
+                        _has_class(node, "togo")):
+                    togo = node
+            if a is None:
+                continue
+            race_url = a.attributes.get("href", "")
+            if race_url.startswith("/"):
+                race_url = race_url[1:]
+            races.append({
+                "race_name": title.text(deep=False, strip=True) if title else
+                    a.text(strip=True),
+                "race_url": race_url,
+                "km_to_go": togo.text(strip=True) if togo else None
+            })
+        return races
+
+    def finished_races(self, soa: bool = False) -> Union[
+            List[Dict[str, Any]], Dict[str, list]]:
+        """
+        Parses races from the 'Results today' homepage section from HTML.
+
+        :param soa: Whether to return the table as dict of columns instead
+            of list of row dicts, which is lighter for big tables. Defaults
+            to False.
+        :return: Table with keys ``race_name``, ``race_url`` and
+            ``category``.
+        """
+        return self._parse_results_ul(self._today_section, soa)
+
+    def yesterday_races(self, soa: bool = False) -> Union[
+            List[Dict[str, Any]], Dict[str, list]]:
+        """
+        Parses races from the 'Results yesterday' homepage section from HTML.
+
+        :param soa: Whether to return the table as dict of columns instead
+            of list of row dicts, which is lighter for big tables. Defaults
+            to False.
+        :return: Table with keys ``race_name``, ``race_url`` and
+            ``category``.
+        """
+        return self._parse_results_ul(self._yesterday_section, soa)
+
+    # The parsing methods are deliberately not fanned out to worker
+    # threads: selectolax holds the GIL for the whole css()/text() call,
+    # so running the four section parsers in a ThreadPoolExecutor would
+    # serialize on the GIL and only add executor overhead. The shared
+    # section lookups below are memoized instead, which removes the
+    # repeated document scans that made parallel parsing look attractive.
+
+    def update_html(self) -> None:
+        """
+        Extends Scraper method to also drop memoized section nodes, so
+        parsing methods read from the refreshed HTML instead of the old
+        parse tree.
+        """
+        super().update_html()
+        self._set_up_html()
+
+    def _set_up_html(self) -> None:
+        """
+        Drops memoized section nodes so they are looked up again from fresh
+        HTML.
+        """
+        for cached in ("_results_sections", "_today_section",
+                       "_yesterday_section", "_next_to_finish_tbody"):
+            self.__dict__.pop(cached, None)
+
+    @cached_property
+    def _next_to_finish_tbody(self) -> Optional[Any]:
+        """'Next to finish' table body node, looked up at most once per
+        instance."""
+        for tbody in self.html.css(_NEXT_TBODY_SEL):
+            heading = tbody.parent.prev
+            while heading is not None and heading.tag != "h3":
+                heading = heading.prev
+            if (heading is not None and
+                    heading.text(deep=False, strip=True) == "Next to finish"):
+                return tbody
+        return None
+
+    @cached_property
+    def _results_sections(self) -> Dict[str, Any]:
+        """
+        Maps heading texts to their 'hp2-results' list nodes. The selector
+        query runs once per instance and serves all results sections.
+        """
+        sections: Dict[str, Any] = {}
+        for ul in self.html.css(_RESULTS_UL_SEL):
+            # the adjacent sibling combinator skips text nodes, so step over
+            # them here too when looking the heading up
+            heading = ul.prev
+            while heading is not None and heading.tag != "h3":
+                heading = heading.prev
+            if heading is not None:
+                # headings hold their text directly, so skip the recursive
+                # descent
+                sections.setdefault(heading.text(deep=False, strip=True), ul)
+        return sections
+
+    @cached_property
+    def _today_section(self) -> Optional[Any]:
+        """'Results today' list node, looked up at most once per instance."""
+        return self._results_sections.get("Results today")
+
+    @cached_property
+    def _yesterday_section(self) -> Optional[Any]:
+        """'Results yesterday' list node, looked up at most once per
+        instance."""
+        return self._results_sections.get("Results yesterday")
+
+    def _parse_results_ul(self, ul: Optional[Any], soa: bool = False
+            ) -> Union[List[Dict[str, Any]], Dict[str, list]]:
+        """
+        Parses races from given 'hp2-results' list node.
+
+        :param ul: List node to parse races from, possibly None.
+        :param soa: Whether to return the table as dict of columns instead
+            of list of row dicts, defaults to False.
+        :return: Table with keys ``race_name``, ``race_url`` and
+            ``category``.
+        """
+        names: list = []
+        urls: list = []
+        categories: list = []
+        for li in (ul.css("li") if ul is not None else []):
+            a = li.css_first("a")
+            if a is None:
+                continue
+            race_url = a.attributes.get("href", "")
+            if race_url.startswith("/"):
+                race_url = race_url[1:]
+            category = li.css_first("span.category")
+            # category codes and race URLs repeat across sections and
+            # batch runs, so keep a single copy of each
+            names.append(a.text(strip=True))
+            urls.append(intern(race_url))
+            categories.append(
+                intern(category.text(deep=False, strip=True)) if category
+                else None)
+        if soa:
+            return {"race_name": names, "race_url": urls,
+                    "category": categories}
+        return [{"race_name": name, "race_url": url, "category": category}
+                for name, url, category in zip(names, urls, categories)]
+
+    def next_to_finish(self, soa: bool = False) -> Union[
+            List[Dict[str, Any]], Dict[str, list]]:
+        """
+        Parses races from the 'Next to finish' homepage section from HTML.
+
+        :param soa: Whether to return the table as dict of columns instead
+            of list of row dicts, which is lighter for big tables. Defaults
+            to False.
+        :return: Table with keys ``race_name``, ``race_url`` and
+            ``time_to_finish``.
+        """
+        tbody = self._next_to_finish_tbody
+        names: list = []
+        urls: list = []
+        times: list = []
+        for row in (tbody.css("tr") if tbody is not None else []):
+            tds = row.css("td")
+            if len(tds) < 3:
+                continue
+            a = tds[1].css_first("a")
+            race_url = a.attributes.get("href", "") if a else ""
+            if race_url.startswith("/"):
+                race_url = race_url[1:]
+            names.append(tds[1].text(strip=True))
+            urls.append(intern(race_url))
+            times.append(tds[2].text(deep=False, strip=True))
+        if soa:
+            return {"race_name": names, "race_url": urls,
+                    "time_to_finish": times}
+        return [{"race_name": name, "race_url": url, "time_to_finish": time}
+                for name, url, time in zip(names, urls, times)]
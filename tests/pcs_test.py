@@ -1,6 +1,10 @@
+from selectolax.parser import HTMLParser
+
 from procyclingstats import (Race, RaceClimbs, RaceStartlist, Ranking, Rider,
-                             RiderResults, Stage, Team)
+                             RiderResults, Stage, Team, TodayRaces)
+from procyclingstats.today_races_scraper import _calendar_url, _has_class
 
+from .fixtures_utils import FixturesUtils
 from .scraper_test_base_class import ScraperTestBaseClass
 
 
@@ -28,3 +32,58 @@ class TestTeam(ScraperTestBaseClass):
 class TestRace(ScraperTestBaseClass):
     ScraperClass = Race
 
+class TestTodayRaces(ScraperTestBaseClass):
+    ScraperClass = TodayRaces
+
+    def test_parse_matches_fixture_exactly(self):
+        """
+        Compares parsed data against the data fixture by value, unlike the
+        generic parser test which only checks shape. Catches cross-item
+        leakage, e.g. a live race with no distance shown stealing the
+        km_to_go of the following item.
+        """
+        f_utils = FixturesUtils(fixtures_path="tests/fixtures/")
+        html = f_utils.get_html_fixture("index.php")
+        obj = TodayRaces("index.php", html, False)
+        assert obj.parse() == f_utils.get_data_fixture("index.php")
+
+
+class TestTodayRacesHelpers:
+    """Direct tests for TodayRaces helpers that don't need fixtures."""
+
+    def test_parse_race_urls(self):
+        html = (
+            '<div class="page-content">'
+            '<a href="/race/tour-de-france/2022">TDF</a>'
+            '<a href="race/vuelta-a-espana/2022">Vuelta</a>'
+            '<a href="/race/tour-de-france/2022">TDF duplicate</a>'
+            '<a href="/team/some-team-2022">not a race</a>'
+            '</div>')
+        expected = ["race/tour-de-france/2022", "race/vuelta-a-espana/2022"]
+        assert sorted(TodayRaces._parse_race_urls(html)) == expected
+        # raw response bytes are parsed the same as str
+        assert sorted(TodayRaces._parse_race_urls(html.encode())) == expected
+        # pages without content div parse to empty list
+        assert TodayRaces._parse_race_urls("<html></html>") == []
+
+    def test_has_class(self):
+        node = HTMLParser('<div class="togo blue"></div>').css_first("div")
+        assert _has_class(node, "togo")
+        assert _has_class(node, "blue")
+        # whole class names only, no substring matches
+        progress = HTMLParser(
+            '<div class="togoprogress"></div>').css_first("div")
+        assert not _has_class(progress, "togo")
+        # node without class attribute
+        plain = HTMLParser("<div></div>").css_first("div")
+        assert not _has_class(plain, "togo")
+
+    def test_calendar_url(self):
+        assert _calendar_url("2022-07-01") == \
+            "https://www.procyclingstats.com/races.php?date=2022-07-01"
+        # query values are urlencoded, so a malformed date can't add
+        # extra parameters
+        assert _calendar_url("2022-07-01&page=2") == \
+            "https://www.procyclingstats.com/races.php?" + \
+            "date=2022-07-01%26page%3D2"
+